@@ -2,10 +2,51 @@
 Belief State module for Dec-POMDP framework
 Represents probability distributions over fire locations
 """
+from functools import lru_cache
 import numpy as np
-from copy import deepcopy
 import config as cfg
-from reward_function import compute_entropy
+
+
+@lru_cache(maxsize=None)
+def _window_slices(grid_size, x, y, window_size):
+    """
+    Index of the observation window centred on (x, y), clipped to the grid.
+    Drones revisit the same cells constantly, so each position's slices are
+    built once and reused.
+    """
+    half_w = window_size // 2
+    return (
+        slice(max(0, x - half_w), min(grid_size, x + half_w + 1)),
+        slice(max(0, y - half_w), min(grid_size, y + half_w + 1)),
+    )
+
+
+def _window(belief, x, y, window_size):
+    """View of the observation window centred on (x, y), clipped to the grid"""
+    return belief[_window_slices(belief.shape[0], int(x), int(y), window_size)]
+
+
+def _normalize(belief):
+    """
+    Rescale belief in place so it sums to 1 (left untouched if it sums to 0).
+    One reduction pass, then one multiply by the reciprocal instead of a divide.
+    """
+    s = belief.sum()
+    if s > 0:
+        belief *= 1.0 / s
+
+
+def _entropy(belief):
+    """
+    Shannon entropy of an already-normalized belief, skipping zero cells.
+    Same value as reward_function.compute_entropy without its validation,
+    clipping and float64 copies.
+    """
+    p = belief[belief > 0]
+    if p.size == 0:
+        return 0.0
+    return float(-np.dot(p, np.log(p)))
+
 
 class BeliefState:
     """
@@ -13,8 +54,10 @@ class BeliefState:
     """
     def __init__(self, grid_size):
         self.grid_size = grid_size
-        # Uniform prior
-        self.belief = np.ones((grid_size, grid_size)) / (grid_size * grid_size)
+        # Uniform prior (float32 is plenty for a distribution over grid_size^2 cells)
+        self.belief = np.full((grid_size, grid_size), 1.0 / (grid_size * grid_size), dtype=np.float32)
+        # Scratch buffer so merges don't allocate temporaries
+        self._scratch = np.empty_like(self.belief)
         self.fire_found = False
         self.fire_location = None
     
@@ -22,40 +65,27 @@ class BeliefState:
         """
         Bayesian update based on drone observation
         """
+        x, y = drone_position
+
         if fire_observed:
-            self.belief = np.zeros((self.grid_size, self.grid_size))
-            x, y = drone_position
-            for i in range(max(0, x - window_size // 2), min(self.grid_size, x + window_size // 2 + 1)):
-                for j in range(max(0, y - window_size // 2), min(self.grid_size, y + window_size // 2 + 1)):
-                    self.belief[i, j] = 1.0
-            self.belief /= self.belief.sum()
+            # Fire is somewhere in the observed window - uniform over it
+            # The normalizer is just the window area, so skip the sum
+            self.belief.fill(0.0)
+            window = _window(self.belief, x, y, window_size)
+            window[...] = 1.0 / window.size
             self.fire_found = True
         else:
             # Fire not found - zero out probability in observed area
-            x, y = drone_position
-            for i in range(max(0, x - window_size // 2), min(self.grid_size, x + window_size // 2 + 1)):
-                for j in range(max(0, y - window_size // 2), min(self.grid_size, y + window_size // 2 + 1)):
-                    self.belief[i, j] = 0.0
-
-            if self.belief.sum() > 0:
-                self.belief /= self.belief.sum()
+            _window(self.belief, x, y, window_size)[...] = 0.0
+            _normalize(self.belief)
     
     def get_entropy(self):
         """Calculate entropy of belief distribution (measure of uncertainty)"""
-        flat_belief = self.belief.flatten()
-        flat_belief = flat_belief[flat_belief > 0] 
-        if len(flat_belief) == 0:
-            return 0.0
-        
-        # belief without compute_entropy function:
-        #return -np.sum(flat_belief * np.log(flat_belief + 1e-10))
-
-        return compute_entropy(self.belief)
+        return _entropy(self.belief)
     
     def get_most_likely_location(self):
-        """Return the cell with highest probability"""
-        max_idx = np.unravel_index(np.argmax(self.belief), self.belief.shape)
-        return np.array(max_idx)
+        """Return the (row, col) cell with highest probability"""
+        return divmod(int(self.belief.argmax()), self.grid_size)
     
     def merge_with_other_belief(self, other_belief, weight=0.5):
         """
@@ -64,11 +94,12 @@ class BeliefState:
         """
         if other_belief.fire_found:
             # If other drone found fire, adopt their belief
-            self.belief = other_belief.belief.copy()
+            np.copyto(self.belief, other_belief.belief)
             self.fire_found = True
             self.fire_location = other_belief.fire_location
         else:
             # Merge beliefs using weighted average
-            self.belief = weight * self.belief + (1 - weight) * other_belief.belief
-            if self.belief.sum() > 0:
-                self.belief /= self.belief.sum()
\ No newline at end of file
+            np.multiply(other_belief.belief, 1.0 - weight, out=self._scratch)
+            self.belief *= weight
+            self.belief += self._scratch
+            _normalize(self.belief)
\ No newline at end of file
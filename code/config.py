@@ -16,6 +16,8 @@ TIME_STEP = 0.05
 MAX_SIMULATION_TIME = 20.0
 STATUS_UPDATE_INTERVAL = 20
 RENDER_PAUSE = 0.1
+RENDER_EVERY = 5  # Steps between rendered frames
+DEBUG = True  # Print per-step drone events (e.g. fire sightings)
 
 # Dec-POMDP parameters
 GAMMA = 0.95
@@ -7,25 +7,38 @@ from copy import deepcopy
 from belief_state import BeliefState
 import config as cfg
 
+# Per-action cell offsets: 0 stay, 1 up, 2 down, 3 left, 4 right, 5 communicate (no move)
+_DX = (0, 0, 0, -1, 1, 0)
+_DY = (0, 1, -1, 0, 0, 0)
+
 class Drone():
     """
     Dec-POMDP Agent with belief state and value-based decision making
     """
-    def __init__(self, drone_id, grid_size, num_drones, window_size=3, time=0, dt=0.05):
+    def __init__(self, drone_id, grid_size, num_drones, window_size=3, time=0, dt=0.05, max_steps=None):
         self.drone_id = drone_id
         self.grid_size = grid_size
         self.window_size = window_size
+        self._half_w = window_size // 2
+        self._gs_m1 = grid_size - 1
         self.num_drones = num_drones
 
         self.time = time
         self.dt = dt
 
-        self.position = np.random.randint(0, self.grid_size, size=2)
+        # Position is mutated in place every step rather than reallocated
+        self.position = np.empty(2, dtype=np.int32)
+        self.position[:] = np.random.randint(0, self.grid_size, size=2)
         
         # Belief state for fire location
         self.belief_state = BeliefState(grid_size)
         
-        self.history = [self.state]
+        # History rows are (x, y, fire_found, time), preallocated for the whole run
+        if max_steps is None:
+            max_steps = int((cfg.MAX_SIMULATION_TIME - cfg.INITIAL_TIME) / dt)
+        self._history = np.empty((max_steps + 1, 4), dtype=np.float64)
+        self._hist_i = 0
+        self._record_state()
         
         # Track visited cells for exploration bonus
         self.visited_cells = set()
@@ -60,17 +73,30 @@ class Drone():
     def state(self):
         return [self.x, self.y, self.belief_state.fire_found, self.time]
 
+    @property
+    def history(self):
+        """Recorded (x, y, fire_found, time) rows, without the unused tail of the buffer"""
+        return self._history[:self._hist_i]
+
+    def _record_state(self):
+        """Append the current state to the preallocated history buffer"""
+        if self._hist_i == len(self._history):
+            # Ran past the expected horizon - double the buffer
+            self._history = np.concatenate([self._history, np.empty_like(self._history)])
+        self._history[self._hist_i] = (self.x, self.y, self.belief_state.fire_found, self.time)
+        self._hist_i += 1
+
     def observe(self, fire_pos):
         """Update belief based on observation"""
-        x_check = (self.x - self.window_size // 2 <= fire_pos[0] <= self.x + self.window_size // 2)
-        y_check = (self.y - self.window_size // 2 <= fire_pos[1] <= self.y + self.window_size // 2)
-        fire_observed = x_check and y_check
+        h = self._half_w
+        dx = self.x - fire_pos[0]
+        dy = self.y - fire_pos[1]
+        fire_observed = (-h <= dx <= h) and (-h <= dy <= h)
         
         # Update belief state
         self.belief_state.update_with_observation(self.position, self.window_size, fire_observed)
         
         if fire_observed:
-            print(f"Drone {self.drone_id} found fire at position {fire_pos}!")
             self.belief_state.fire_location = fire_pos.copy()
         
         return fire_observed
@@ -146,14 +172,13 @@ class Drone():
         Compute expected information gain from moving to next_position
         Based on reduction in belief entropy
         """
-        temp_belief = deepcopy(self.belief_state.belief)
         x, y = next_position
+        h = self._half_w
         
         # Calculate expected information gain
-        observation_area = 0
-        for i in range(max(0, x - self.window_size // 2), min(self.grid_size, x + self.window_size // 2 + 1)):
-            for j in range(max(0, y - self.window_size // 2), min(self.grid_size, y + self.window_size // 2 + 1)):
-                observation_area += temp_belief[i, j]
+        x0 = x - h if x > h else 0
+        y0 = y - h if y > h else 0
+        observation_area = self.belief_state.belief[x0:x + h + 1, y0:y + h + 1].sum()
         
         # Check if ANY drone has visited this cell (including us)
         cell_visited_by_anyone = tuple(next_position) in self.visited_cells
@@ -162,6 +187,15 @@ class Drone():
         exploration_bonus = self.exploration_bonus if not cell_visited_by_anyone else 0
         
         return observation_area + exploration_bonus
+
+    def _next_cell(self, action):
+        """Cell reached by taking action from the current position, clamped to the grid"""
+        x = self.x + _DX[action]
+        y = self.y + _DY[action]
+        x = 0 if x < 0 else (self._gs_m1 if x > self._gs_m1 else x)
+        y = 0 if y < 0 else (self._gs_m1 if y > self._gs_m1 else y)
+        return x, y
+
     def compute_q_value(self, action):
         """
         Compute Q-value for an action using Dec-POMDP value function
@@ -169,16 +203,7 @@ class Drone():
         
         """
         # Simulate movement actions
-        x, y = self.x, self.y
-        
-        if action == 1:  # Up
-            y = min(self.grid_size - 1, y + 1)
-        elif action == 2:  # Down
-            y = max(0, y - 1)
-        elif action == 3:  # Left
-            x = max(0, x - 1)
-        elif action == 4:  # Right
-            x = min(self.grid_size - 1, x + 1)
+        x, y = self._next_cell(action)
         
         next_position = np.array([x, y])
         
@@ -283,26 +308,18 @@ class Drone():
 
     def action(self, action, fire_pos):
         """Execute action and update state"""
-        x = self.x
-        y = self.y
-        
         is_communication = (action == 5)
         
-        if action == 1:  # Up
-            y = min(self.grid_size - 1, self.y + 1)
-        elif action == 2:  # Down
-            y = max(0, self.y - 1)
-        elif action == 3:  # Left
-            x = max(0, self.x - 1)
-        elif action == 4:  # Right
-            x = min(self.grid_size - 1, self.x + 1)
+        x, y = self._next_cell(action)
 
-        self.position = np.array([x, y])
+        self.position[0] = x
+        self.position[1] = y
         self.visited_cells.add((x, y))
-        self.observe(fire_pos)
+        if self.observe(fire_pos) and cfg.DEBUG:
+            print(f"Drone {self.drone_id} found fire at position {fire_pos}!")
         self.time += self.dt
         self.update_beliefs(self.dt)
-        self.history.append(self.state)
+        self._record_state()
 
         telemetry_packet = None
         if is_communication:
@@ -16,7 +16,7 @@ class SearchEnv(Env):
     def __init__(self, grid_size=10):
         self.grid_size = grid_size
         self.fig, self.ax = None, None
-        self.fire_pos = np.random.randint(0, self.grid_size, size=2)
+        self.fire_pos = np.random.randint(0, self.grid_size, size=2)  # also sets fire_x / fire_y
         self.patches = []
         self.communication_cost = cfg.COMMUNICATION_COST
         self.movement_cost = cfg.MOVEMENT_COST
@@ -29,6 +29,28 @@ class SearchEnv(Env):
         # Per-step time penalty parameter for global reward function
         self.kappa = cfg.TIME_COST
 
+        # Rendering constants, built once rather than every frame
+        self._cmap = colors.ListedColormap(cfg.GRID_COLORS)
+        self._norm = colors.BoundaryNorm([0, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5], self._cmap.N)
+        self._minor_ticks = np.arange(-.5, self.grid_size, 1)
+        self._grid = np.zeros((self.grid_size, self.grid_size))
+        self._bg = None
+
+        # (num_drones, 2) drone positions, refreshed from the drones by render()
+        self._positions = None
+        self._drone_cells = None
+
+    @property
+    def fire_pos(self):
+        return self._fire_pos
+
+    @fire_pos.setter
+    def fire_pos(self, pos):
+        """Store the fire cell as an int32 array plus plain-int coordinates for the hot paths"""
+        self._fire_pos = np.asarray(pos, dtype=np.int32)
+        self.fire_x = int(self._fire_pos[0])
+        self.fire_y = int(self._fire_pos[1])
+
     def step(self, drones, actions):
         """Execute actions, handle communication, and compute global reward."""
         telemetry_packets = []
@@ -54,10 +76,10 @@ class SearchEnv(Env):
                 if drone.drone_id != packet['sender_id']:
                     drone.receive_telemetry(packet, communication_noise=0.05)
 
-        # 3) Check for fire extinguished (unchanged)
-        for drone in drones:
-            if drone.x == self.fire_pos[0] and drone.y == self.fire_pos[1]:
-                if not self.fire_extinguished:
+        # 3) Check for fire extinguished
+        if not self.fire_extinguished:
+            for drone in drones:
+                if drone.x == self.fire_x and drone.y == self.fire_y:
                     self.fire_extinguished = True
                     self.time_to_extinguish = drone.time
                     total_step_cost = (
@@ -74,6 +96,7 @@ class SearchEnv(Env):
                     print(
                         f"Time: {self.time_cost}"
                     )
+                    break
 
         # Accumulate “real” costs for logging
         self.total_communications += comm_count
@@ -99,67 +122,99 @@ class SearchEnv(Env):
         return reward, self.fire_extinguished
 
     def render(self, drones):
-        grid = np.zeros((self.grid_size, self.grid_size))
+        grid = self._grid
+        grid.fill(0)
         
         if not self.fire_extinguished:
-            grid[tuple(self.fire_pos)] = 1
+            grid[self.fire_x, self.fire_y] = 1
 
-        for idx, drone in enumerate(drones):
-            grid[tuple(drone.position)] = idx + 2
+        # Draw from the drones passed in, so moves made outside step() show up too
+        self._update_positions(drones)
+        grid[self._positions[:, 0], self._positions[:, 1]] = self._drone_cells
 
-        cmap = colors.ListedColormap(['white', 'red', 'blue', 'green', 'orange', 'purple'])
-        bounds = [0, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
-        norm = colors.BoundaryNorm(bounds, cmap.N)
+        title = f'Dec-POMDP Multi-Agent Search | Cost: {self.total_cost:.1f} | Comms: {self.total_communications}'
+        if self.fire_extinguished:
+            title += ' | EXTINGUISHED!'
 
         if self.fig is None:
             self.fig, self.ax = plt.subplots(figsize=(10, 10))
-            self.im = self.ax.imshow(grid, cmap=cmap, norm=norm)
-            self.ax.set_xticks(np.arange(-.5, self.grid_size, 1), minor=True)
-            self.ax.set_yticks(np.arange(-.5, self.grid_size, 1), minor=True)
+            self.im = self.ax.imshow(grid, cmap=self._cmap, norm=self._norm, animated=True)
+            self.ax.set_xticks(self._minor_ticks, minor=True)
+            self.ax.set_yticks(self._minor_ticks, minor=True)
             self.ax.grid(which='minor', color='gray', linestyle='-', linewidth=1)
-            
-            title = f'Dec-POMDP Multi-Agent Search | Cost: {self.total_cost:.1f} | Comms: {self.total_communications}'
-            if self.fire_extinguished:
-                title += ' | EXTINGUISHED!'
-            self.ax.set_title(title)
+            self.ax.set_title(title).set_animated(True)
+
+            # One persistent observation-window outline per drone, moved every frame
+            self.patches.clear()
+            for drone in drones:
+                rectangle = patches.Rectangle(
+                    (0, 0),
+                    drone.window_size,
+                    drone.window_size,
+                    linewidth=2,
+                    edgecolor='black',
+                    facecolor='none',
+                    animated=True
+                )
+                self.ax.add_patch(rectangle)
+                self.patches.append(rectangle)
+
+            # Static background is re-captured on every full redraw (e.g. window resize)
+            self.fig.canvas.mpl_connect('draw_event', self._on_draw)
 
             plt.ion()
             plt.show(block=False)
         else:
             self.im.set_data(grid)
-            title = f'Dec-POMDP Multi-Agent Search | Cost: {self.total_cost:.1f} | Comms: {self.total_communications}'
-            if self.fire_extinguished:
-                title += ' | EXTINGUISHED!'
-            self.ax.set_title(title)
+            self.ax.title.set_text(title)
 
-        for p in self.patches:
-            p.remove()
-        self.patches.clear()
-
-        for drone in drones:
+        for drone, rectangle in zip(drones, self.patches):
             corner_x = drone.x - drone.window_size // 2 - 0.5
             corner_y = drone.y - drone.window_size // 2 - 0.5
+            rectangle.set_xy((corner_y, corner_x))
 
-            rectangle = patches.Rectangle(
-                (corner_y, corner_x),
-                drone.window_size,
-                drone.window_size,
-                linewidth=2,
-                edgecolor='black',
-                facecolor='none'
-            )
-            self.ax.add_patch(rectangle)
-            self.patches.append(rectangle)
-        
-        self.fig.canvas.draw()
-        self.fig.canvas.flush_events()
+        canvas = self.fig.canvas
+        if self._bg is None or not canvas.supports_blit:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._bg)
+            self._draw_animated()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
         
         return self.fig
 
+    def _update_positions(self, drones):
+        """Copy each drone's position into the shared positions array"""
+        if self._positions is None or len(self._positions) != len(drones):
+            self._positions = np.empty((len(drones), 2), dtype=np.intp)
+            self._drone_cells = np.arange(2, 2 + len(drones))
+        for idx, drone in enumerate(drones):
+            self._positions[idx] = drone.position
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw and paint the animated artists on top"""
+        if self.fig.canvas.supports_blit:
+            self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        """Draw the per-frame artists: grid image, cell lines, frame, title and drone windows"""
+        self.ax.draw_artist(self.im)
+        # The image covers the cell lines and axes frame drawn in the background, so redraw them
+        for tick in self.ax.xaxis.get_minor_ticks() + self.ax.yaxis.get_minor_ticks():
+            self.ax.draw_artist(tick.gridline)
+        for spine in self.ax.spines.values():
+            self.ax.draw_artist(spine)
+        self.ax.draw_artist(self.ax.title)
+        for rectangle in self.patches:
+            self.ax.draw_artist(rectangle)
+
     def close(self):
         if self.fig:
             plt.close(self.fig)
             self.fig = None
+            self._bg = None
 
 
     # Helper function to get the team-level belief over fire location for global reward function
@@ -171,12 +226,12 @@ class SearchEnv(Env):
         """
         beliefs = [d.belief_state.belief for d in drones]
         stacked = np.stack(beliefs, axis=0)            # shape: (num_drones, G, G)
-        team_belief = stacked.mean(axis=0)             # average over drones
+        team_belief = stacked.mean(axis=0, dtype=np.float64)  # average over drones (float32 beliefs)
 
         # Normalize just in case of numerical drift
         total = team_belief.sum()
         if total > 0:
-            team_belief = team_belief / total
+            team_belief *= 1.0 / total
         else:
             # fallback: uniform if something went horribly wrong
             team_belief = np.ones_like(team_belief) / team_belief.size
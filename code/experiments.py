@@ -46,7 +46,7 @@ def print_final_results(env):
 
 
 def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05, 
-                   status_interval=20, render_pause=0.1):
+                   status_interval=20, render_pause=0.1, render_every=5):
     """
     Run the complete Dec-POMDP multi-agent simulation
     
@@ -57,6 +57,7 @@ def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05,
         dt: time step size
         status_interval: steps between status updates
         render_pause: pause duration for rendering (seconds)
+        render_every: steps between rendered frames
     """
     t_0 = cfg.INITIAL_TIME
     dt = cfg.TIME_STEP
@@ -75,10 +76,10 @@ def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05,
     num_drones = cfg.NUM_DRONES
 
     Drone1 = Drone(drone_id=0, grid_size=grid_size, num_drones=num_drones, time=t_0, window_size=window_size)
-    Drone1.position = np.array([1, 1])
+    Drone1.position[:] = (1, 1)
     
     Drone2 = Drone(drone_id=1, grid_size=grid_size, num_drones=num_drones, time=t_0, window_size=window_size)
-    Drone2.position = np.array([1, grid_size - 2])
+    Drone2.position[:] = (1, grid_size - 2)
 
     drones = [Drone1, Drone2]
     
@@ -88,9 +89,9 @@ def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05,
     #fig = env.render(drones)
     #plt.savefig("InitialPositions.png")
     for i in range(N):
-        if RENDER_LIVE:
+        if RENDER_LIVE and i % render_every == 0:
             fig = env.render(drones)
-            plt.pause(0.1)
+            plt.pause(render_pause)
             
         if env.fire_extinguished:
             print(f"Fire extinguished! Showing final state...")
@@ -194,7 +195,8 @@ if __name__ == '__main__':
             t_f=cfg.MAX_SIMULATION_TIME,
             dt=cfg.TIME_STEP,
             status_interval=cfg.STATUS_UPDATE_INTERVAL,
-            render_pause=cfg.RENDER_PAUSE
+            render_pause=cfg.RENDER_PAUSE,
+            render_every=cfg.RENDER_EVERY
         )
     
         plot_results(entropy_drone1, entropy_drone2, time, final_time, total_cost, total_comms, i, filename_prefix)
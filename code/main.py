@@ -74,7 +74,7 @@ def print_final_results(env):
 
 
 def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05, 
-                   status_interval=20, render_pause=0.1):
+                   status_interval=20, render_pause=0.1, render_every=5):
     """
     Run the complete Dec-POMDP multi-agent simulation
     
@@ -85,6 +85,7 @@ def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05,
         dt: time step size
         status_interval: steps between status updates
         render_pause: pause duration for rendering (seconds)
+        render_every: steps between rendered frames
     """
     t_0 = cfg.INITIAL_TIME
     dt = cfg.TIME_STEP
@@ -101,9 +102,10 @@ def run_simulation(grid_size=10, num_drones=2, t_f=10, dt=0.05,
     
     # Main simulation loop
     for i in range(N):
-        # Render current state
-        fig = env.render(drones)
-        plt.pause(render_pause)
+        # Render current state (only every render_every steps)
+        if i % render_every == 0:
+            fig = env.render(drones)
+            plt.pause(render_pause)
         
         # Check if fire is extinguished
         if env.fire_extinguished:
@@ -139,5 +141,6 @@ if __name__ == '__main__':
         t_f=cfg.MAX_SIMULATION_TIME,
         dt=cfg.TIME_STEP,
         status_interval=cfg.STATUS_UPDATE_INTERVAL,
-        render_pause=cfg.RENDER_PAUSE
+        render_pause=cfg.RENDER_PAUSE,
+        render_every=cfg.RENDER_EVERY
     )
\ No newline at end of file
@@ -1,7 +1,6 @@
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.stats import norm
 import os
 
 def run():
@@ -33,6 +32,15 @@ def run():
     colors = ['blue', 'green', 'red']
 
     # --- PLOT 1-3: NORMAL DISTRIBUTIONS ---
+    # Force columns to numeric. "FAILED" strings become NaN and are skipped below,
+    # so each column is fit on its successes only
+    present = [col for col in columns_to_plot if col in df.columns]
+    numeric = df[present].apply(pd.to_numeric, errors='coerce')
+
+    # Closed-form MLE fit for every column at once (same as norm.fit)
+    mus = numeric.mean()
+    stds = numeric.std(ddof=0)
+
     for i, col in enumerate(columns_to_plot):
         ax = axes_flat[i]
         
@@ -40,9 +48,7 @@ def run():
             ax.text(0.5, 0.5, 'Data Not Found', ha='center', va='center')
             continue
         
-        # Force column to numeric. "FAILED" strings become NaN
-        raw_data = pd.to_numeric(df[col], errors='coerce')
-        data = raw_data.dropna() # Successes only
+        data = numeric[col].dropna() # Successes only
         
         # Skip if empty
         if len(data) < 2:
@@ -50,15 +56,17 @@ def run():
             continue
 
         # Statistics
-        mu, std = norm.fit(data)
+        mu, std = mus[col], stds[col]
         
-        # Histogram
-        ax.hist(data, bins=16, density=True, alpha=0.5, color=colors[i], label='Actual Data')
+        # Histogram (binned with numpy, drawn as plain bars)
+        density, edges = np.histogram(data.to_numpy(), bins=16, density=True)
+        ax.bar(edges[:-1], density, width=np.diff(edges), align='edge',
+               alpha=0.5, color=colors[i], label='Actual Data')
         
         # Normal Curve
         xmin, xmax = ax.get_xlim()
         x = np.linspace(xmin, xmax, 100)
-        p = norm.pdf(x, mu, std)
+        p = np.exp(-0.5 * ((x - mu) / std) ** 2) / (std * np.sqrt(2 * np.pi))
         ax.plot(x, p, 'k', linewidth=2, label='Normal Dist. Fit')
         
         # Formatting